@@ -15,6 +15,12 @@ Serializer __init__ accepts the following parameters:
               as well in order to customize 'dumps' function from the 'json' module)
               For example: Serializer(data=data, many=True, to_json=True, 
                                       allow_nan=False, skipkeys=True)
+
+Large lists of objects can be serialized lazily with the 'serialize_iter' method,
+objects are serialized one at a time instead of building the whole list in memory.
+(With 'to_json=True' chunks of the json string are yielded instead)
+    For example: for ser in Serializer(data=data, many=True).serialize_iter(): ...
+
 Usage:
     from serializer import Serializer
 
@@ -110,6 +116,23 @@ Usage:
             disable_accessor = (
                 'g__nested_object'
             )
+
+            +----------------------- Set 'memoize' to 'True' in order to serialize the same object
+            |                        only once per serialization, serialized data is reused
+            |                        when the object is encountered again.
+            v
+            memoize = True
+
+            +----------------------- Set 'use_orjson' to 'True' in order to use 'orjson' instead of
+            |                        the 'json' module when 'to_json=True'. Only 'sort_keys' and
+            |                        'indent=2' options are supported. Output differs from the 'json'
+            |                        module: separators are compact, non-ASCII characters are not
+            |                        escaped, 'NaN' is written as 'null', and values such as 'UUID'
+            |                        and 'Enum' are serialized natively instead of being passed
+            |                        to the serializer. Integers that exceed 64-bit range
+            |                        are not supported.
+            v
+            use_orjson = True
         
         ### [COMBINING SERIALIZERS] Combine Serializers including Mixin classes by using class inheritance
 
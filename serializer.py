@@ -4,8 +4,9 @@
 * make_serializer - Dynamically construct the Serializer class
 """
 
+import sys
 import keyword
-from json import dumps
+from json import JSONEncoder, dumps
 from operator import attrgetter
 from itertools import chain
 from collections import ChainMap
@@ -22,18 +23,27 @@ from typing import (
     Dict,
     Any,
     MutableMapping,
+    Hashable,
+    Iterator,
+    Mapping,
 )
 
-from types import new_class
+from types import new_class, MappingProxyType
 
 from .exceptions import SerializerError, MethodError, FieldError, FieldIdentifierError
 from .utils import (
     AnnotationsChainMap,
+    LRUCache,
     get_attr,
     construct_accessor,
     add_docstring,
-    apply_getters,
-    apply_getters_many,
+    compile_getters,
+    serialize_many,
+    orjson_dumps,
+    orjson_iterencode,
+    json_iterencode,
+    memoize,
+    MEMO,
 )
 
 from .docstrings import SERIALIZER, MAKE_SERIALIZER
@@ -50,7 +60,11 @@ Getter = Callable
 MergedAnnotations = ChainMap_[str, Any]
 MergedNamespaces = ChainMap_[str, Any]
 Field = Tuple[FieldAlias, Getter, Union[Callable, None]]
-ParsedFields = Dict[GetterName, Field]
+ParsedFields = Mapping[GetterName, Field]
+IsOptional = bool
+AttributeNames = Union[Tuple[str, ...], None]
+FieldAccessor = Tuple[IsOptional, AttributeNames]
+ParsedAccessors = Mapping[GetterName, FieldAccessor]
 SerializedData = Union[List[Dict], Dict, str, None]
 
 # ------------------------------------------------------------------------------------- #
@@ -59,7 +73,20 @@ SerializedData = Union[List[Dict], Dict, str, None]
 ANNOTATIONS = "__annotations__"
 NAMESPACE = "__dict__"
 FIELDS = "_Serializer__fields"
+ACCESSORS = "_Serializer__accessors"
+FIELDS_LIST = "_Serializer__fields_list"
+ACCESSORS_LIST = "_Serializer__accessors_list"
+SERIALIZE_ONE = "_Serializer__serialize_one"
+MEMOIZE = "_Serializer__memoize"
+SELECTIONS = "_Serializer__selections"
+USE_ORJSON = "_Serializer__use_orjson"
 WITHOUT_CALLABLE = None
+# Data has not been serialized yet
+MISSING = object()
+FIELDS_CACHE_SIZE = 256
+SELECTIONS_CACHE_SIZE = 128
+# Parsed fields and serialization function shared by the classes with the same key
+FIELDS_CACHE: LRUCache = LRUCache(FIELDS_CACHE_SIZE)
 
 # ------------------------------------------------------------------------------------- #
 # SERIALIZER
@@ -67,71 +94,84 @@ WITHOUT_CALLABLE = None
 
 @add_docstring(doc=SERIALIZER)
 class Serializer:
+    __slots__ = (
+        "data",
+        "many",
+        "to_json",
+        "dumps_options",
+        "_serialized_data",
+        "_fields",
+        "_accessors",
+        "_serialize_one",
+    )
+
     @classmethod
     def _merge_bases(
         cls: Type["Serializer"]
     ) -> Tuple[MergedAnnotations, MergedNamespaces]:
         """Merge annotations and namespaces of all base classes in the mro."""
 
-        return (
-            AnnotationsChainMap(
-                *(
-                    getattr(base, ANNOTATIONS, {})
-                    for base in cls.mro()
-                    if base is not object
-                )
-            ),
-            ChainMap(
-                *(
-                    getattr(base, NAMESPACE, {})
-                    for base in cls.mro()
-                    if base is not object
-                )
-            ),
-        )
+        annotations, namespaces = [], []
+
+        for base in cls.__mro__:
+            # Slots of the 'Serializer' must not be mistaken for the field aliases
+            if base is object or base is Serializer:
+                continue
+            annotations.append(getattr(base, ANNOTATIONS, {}))
+            namespaces.append(getattr(base, NAMESPACE, {}))
+
+        return AnnotationsChainMap(*annotations), ChainMap(*namespaces)
 
     @classmethod
     def _construct_fields(
         cls: Type["Serializer"], fields: MergedAnnotations, namespace: MergedNamespaces
-    ) -> ParsedFields:
-        """Parse the merged annotations and construct the serializer fields."""
+    ) -> Tuple[ParsedFields, ParsedAccessors]:
+        """Parse the merged annotations and construct the serializer fields.
+
+        Optional flag and the attribute names used by the generated
+        serialization function are kept separately as the field accessors.
+        """
 
-        parsed_fields = {}
+        parsed_fields, parsed_accessors = {}, {}
         settings = namespace.get("Settings")
-        optional_fields = getattr(settings, "optional", set())
-        disable_accessor = getattr(settings, "disable_accessor", set())
+        optional_fields = frozenset(getattr(settings, "optional", ()))
+        disable_accessor = frozenset(getattr(settings, "disable_accessor", ()))
 
         for field_name, callable_ in fields.items():
             # Check if new alias is provided -> a: str = 'new_alias_a'
             field_alias = namespace.get(field_name, field_name)
+            # Same key object is reused by every serialized dictionary
+            if type(field_alias) is str:
+                field_alias = sys.intern(field_alias)
 
-            getter_name = (
+            getter_name = sys.intern(
                 field_name
                 if field_name in disable_accessor
                 else construct_accessor(field_name)
             )
-            getter = (
-                get_attr(getter_name)
-                if field_name in optional_fields
-                else attrgetter(getter_name)
-            )
+            optional = field_name in optional_fields
+            getter = get_attr(getter_name) if optional else attrgetter(getter_name)
+            attribute_names = tuple(getter_name.split("."))
 
             if callable_ is Ellipsis:
                 callable_ = WITHOUT_CALLABLE
             elif isinstance(callable_, Serializer):
+                # Generated function of the nested serializer is bound
+                # as the default argument of the generated function
                 callable_ = (
-                    apply_getters_many(callable_._fields)
+                    serialize_many(callable_._serialize_one)
                     if callable_.many
-                    else apply_getters(callable_._fields)
+                    else callable_._serialize_one
                 )
             elif isinstance(callable_, type) and issubclass(callable_, Serializer):
-                callable_ = apply_getters(callable_()._fields)
+                callable_ = getattr(callable_, SERIALIZE_ONE)
             elif isinstance(callable_, str):
                 # Field getter can be changed with this syntax
                 # a: 'getter_name' -> Where 'getter_name' is method in the class body
                 try:
                     getter = namespace[callable_].__get__(cls)
                     callable_ = WITHOUT_CALLABLE
+                    attribute_names = None
                 except KeyError:
                     raise MethodError(
                         f"Missing '{callable_}' method in the serializer body"
@@ -146,12 +186,151 @@ class Serializer:
                 )
 
             parsed_fields[field_name] = (field_alias, getter, callable_)
+            parsed_accessors[field_name] = (optional, attribute_names)
+
+        return parsed_fields, parsed_accessors
+
+    @staticmethod
+    def _cache_token(value: Any) -> Hashable:
+        """Identify the annotation or the namespace value in the cache key."""
+
+        # Nested serializer instance is identified by its serialization function
+        if isinstance(value, Serializer):
+            return type(value), value.many, value._serialize_one
+        # Equal values of the different types (e.g. '1' and 'True') must not match
+        return type(value), value
+
+    @classmethod
+    def _fields_cache_key(
+        cls: Type["Serializer"], fields: MergedAnnotations
+    ) -> Optional[Hashable]:
+        """Construct the key under which the parsed fields of the class are cached.
+
+        Returns 'None' when the parsed fields can not be shared with other classes.
+        """
+
+        # Getter methods are bound to the class itself
+        if any(isinstance(callable_, str) for callable_ in fields.values()):
+            return None
+
+        field_names = set(fields)
+        key = (
+            cls.__mro__[1:],
+            tuple(
+                (name, cls._cache_token(value))
+                for name, value in getattr(cls, NAMESPACE).get(ANNOTATIONS, {}).items()
+            ),
+            tuple(
+                (name, cls._cache_token(value))
+                for name, value in getattr(cls, NAMESPACE).items()
+                if name in field_names
+                or not (name.startswith("__") and name.endswith("__"))
+            ),
+        )
+        try:
+            hash(key)
+        except TypeError:
+            return None
+
+        return key
+
+    @classmethod
+    def _extend_parent_fields(
+        cls: Type["Serializer"], namespace: MergedNamespaces
+    ) -> Optional[Tuple[ParsedFields, ParsedAccessors]]:
+        """Reuse the parsed fields of the single parent class
+        and parse only the fields annotated on the class itself.
+
+        Returns 'None' when the parent fields can not be reused.
+        """
+
+        parent, *other_bases = cls.__bases__
+        parent_fields = getattr(parent, FIELDS, None)
+        parent_accessors = getattr(parent, ACCESSORS, None)
+        own_namespace = getattr(cls, NAMESPACE)
+
+        if (
+            other_bases
+            or parent_fields is None
+            or "Settings" in own_namespace
+            # Field alias is changed or getter method is bound to the parent class
+            or any(
+                field_name in own_namespace or attribute_names is None
+                for field_name, (_, attribute_names) in parent_accessors.items()
+            )
+        ):
+            return None
 
-        return parsed_fields
+        parsed_fields, parsed_accessors = cls._construct_fields(
+            own_namespace.get(ANNOTATIONS, {}), namespace
+        )
+        for field_name, field in parent_fields.items():
+            parsed_fields.setdefault(field_name, field)
+            parsed_accessors.setdefault(field_name, parent_accessors[field_name])
+
+        return parsed_fields, parsed_accessors
 
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
-        cls.__fields = cls._construct_fields(*cls._merge_bases())
+        fields, namespace = cls._merge_bases()
+        key = cls._fields_cache_key(fields)
+
+        try:
+            cls.__fields, cls.__accessors, serialize_one = FIELDS_CACHE[key]
+        except KeyError:
+            parsed = cls._extend_parent_fields(namespace)
+            if parsed is None:
+                parsed = cls._construct_fields(fields, namespace)
+            # Parsed fields are shared, hence they are exposed as read-only
+            cls.__fields, cls.__accessors = map(MappingProxyType, parsed)
+            serialize_one = compile_getters(
+                list(cls.__fields.values()), list(cls.__accessors.values())
+            )
+            if key is not None:
+                FIELDS_CACHE[key] = cls.__fields, cls.__accessors, serialize_one
+
+        # Default selection of the fields, shared by all the instances
+        cls.__fields_list = tuple(cls.__fields.values())
+        cls.__accessors_list = tuple(cls.__accessors.values())
+
+        cls.__memoize = getattr(namespace.get("Settings"), "memoize", False)
+        if cls.__memoize:
+            serialize_one = memoize(serialize_one)
+        cls.__serialize_one = staticmethod(serialize_one)
+        cls.__use_orjson = getattr(namespace.get("Settings"), "use_orjson", False)
+        # Subsets of the fields selected by the instances
+        cls.__selections = LRUCache(SELECTIONS_CACHE_SIZE)
+
+    @classmethod
+    def _select_fields(
+        cls: Type["Serializer"], fields: Tuple[str, ...]
+    ) -> Tuple[Tuple[Field, ...], Tuple[FieldAccessor, ...], Callable]:
+        """Select the subset of the fields and generate its serialization function."""
+
+        parsed_fields = getattr(cls, FIELDS)
+        requested_fields = set(fields)
+        unknown_fields = requested_fields - parsed_fields.keys()
+        if unknown_fields:
+            raise FieldError(
+                f"One or more unknown fields are being passed: "
+                f"{', '.join(unknown_fields)}"
+            )
+        # Selected fields keep the order in which they are defined
+        fields = [
+            getter_name
+            for getter_name in parsed_fields
+            if getter_name in requested_fields
+        ]
+        parsed_accessors = getattr(cls, ACCESSORS)
+        selected_fields = tuple(parsed_fields[getter_name] for getter_name in fields)
+        selected_accessors = tuple(
+            parsed_accessors[getter_name] for getter_name in fields
+        )
+        serialize_one = compile_getters(selected_fields, selected_accessors)
+        if getattr(cls, MEMOIZE):
+            serialize_one = memoize(serialize_one)
+
+        return selected_fields, selected_accessors, serialize_one
 
     def __new__(cls, *args, **kwargs):
         if cls is Serializer:
@@ -171,22 +350,20 @@ class Serializer:
         self.data = data
         self.many = many
         self.to_json = to_json
-        self.dumps_options = dumps_options or {}
-        self._serialized_data: SerializedData = None
-        # Create a shallow-copy
-        self._fields: List[Field] = list(self.get_fields.values())
-        if fields is not None:
-            unknown_fields = set(fields) - self.get_fields.keys()
-            if unknown_fields:
-                raise FieldError(
-                    f"One or more unknown fields are being passed: "
-                    f"{', '.join(unknown_fields)}"
-                )
-            self._fields = [
-                field
-                for getter_name, field in self.get_fields.items()
-                if getter_name in fields
-            ]
+        self.dumps_options = dumps_options
+        self._serialized_data: SerializedData = MISSING
+        if fields is None:
+            self._fields: Sequence[Field] = getattr(self, FIELDS_LIST)
+            self._accessors: Sequence[FieldAccessor] = getattr(self, ACCESSORS_LIST)
+            self._serialize_one: Callable = getattr(self, SERIALIZE_ONE)
+        else:
+            selections = getattr(self, SELECTIONS)
+            fields = tuple(fields)
+            try:
+                selection = selections[fields]
+            except KeyError:
+                selection = selections[fields] = self._select_fields(fields)
+            self._fields, self._accessors, self._serialize_one = selection
 
     @property
     def get_fields(self) -> ParsedFields:
@@ -198,22 +375,52 @@ class Serializer:
     def serialize(self) -> SerializedData:
         """Serialize either single object or list of the objects."""
 
-        if self._serialized_data:
+        if self._serialized_data is not MISSING:
             return self._serialized_data
 
-        getter = apply_getters(self._fields)
+        getter = self._serialize_one
+        # Objects are memoized only for the duration of the single serialization
+        token = MEMO.set({})
 
-        if self.to_json:
-            self._serialized_data = dumps(
-                self.data, default=getter, **self.dumps_options
-            )
-        elif self.many:
-            self._serialized_data = list(map(getter, self.data))
-        else:
-            self._serialized_data = getter(self.data)
+        try:
+            if self.to_json:
+                dumps_ = orjson_dumps if getattr(self, USE_ORJSON) else dumps
+                self._serialized_data = dumps_(
+                    self.data, default=getter, **self.dumps_options
+                )
+            elif self.many:
+                self._serialized_data = [getter(obj) for obj in self.data]
+            else:
+                self._serialized_data = getter(self.data)
+        finally:
+            MEMO.reset(token)
 
         return self._serialized_data
 
+    def serialize_iter(self) -> Iterator[Union[Dict, str]]:
+        """Lazily serialize the list of the objects, one object at a time.
+
+        With 'to_json=True' chunks of the json string are yielded instead.
+        """
+
+        getter = self._serialize_one
+
+        if self.to_json and getattr(self, USE_ORJSON):
+            if self.many:
+                return orjson_iterencode(self.data, getter, **self.dumps_options)
+            return iter((orjson_dumps(self.data, getter, **self.dumps_options),))
+        if self.to_json:
+            dumps_options = dict(self.dumps_options)
+            encoder = dumps_options.pop("cls", None) or JSONEncoder
+            encoder = encoder(default=getter, **dumps_options)
+            if self.many:
+                return json_iterencode(self.data, encoder)
+            return encoder.iterencode(self.data)
+        if self.many:
+            return (getter(obj) for obj in self.data)
+
+        return iter((getter(self.data),))
+
 
 @add_docstring(doc=MAKE_SERIALIZER)
 def make_serializer(
@@ -1,20 +1,55 @@
 """This module contains the utility functions for the serializer package.
 
 * AnnotationsChainMap - ChainMap that returns a ordered keys
+* LRUCache - Dictionary that evicts the least recently used items
 * HasNoAttribute - Singleton class object
+* HAS_NO_ATTRIBUTE - Instance of the HasNoAttribute, returned for the missing attributes
 * construct_accessor - Function that is used to enable access to the nested fields
-* coroutine - Function that primes the coroutine and returns the generator 'send' function
-* apply_getters - Function that will apply all the methods
-                  on the object that needs to be serialized
-* apply_getters_many - Wrapper around the 'apply_getters' for multiple object serialization
-* get_attr - Function that implements attribute getter using coroutine
+* serialize_many - Wrapper around the generated serialization function
+                   for multiple object serialization
+* compile_getters - Function that generates the specialised serialization function
+                    for the given fields
+* memoize - Function that reuses the already serialized objects
+            during the single serialization
+* get_attr - Function that returns the attribute getter for the optional fields
+* orjson_dumps - Function that serializes the object to the json string using 'orjson'
+* iterencode_array - Function that serializes the list of the objects
+                     to the chunks of the json array
+* json_iterencode - Function that serializes the list of the objects
+                    to the chunks of the json string
+* orjson_iterencode - Function that serializes the list of the objects
+                      to the chunks of the json string using 'orjson'
 """
 
-from typing import Union, Type, Any, Callable, Tuple, List, Generator, Dict
+import re
+import keyword
+import unicodedata
+
+from typing import (
+    Union,
+    Type,
+    Any,
+    Callable,
+    Tuple,
+    List,
+    Dict,
+    Sequence,
+    Iterable,
+    Iterator,
+)
 from types import FunctionType
-from collections import ChainMap
+from collections import ChainMap, OrderedDict
 from itertools import chain
-from functools import wraps, partial
+from functools import partial, lru_cache
+from json import JSONEncoder
+from contextvars import ContextVar
+
+from .exceptions import SerializerError
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
 
 
 # ------------------------------------------------------------------------------------- #
@@ -23,8 +58,18 @@ from functools import wraps, partial
 FieldAlias = str
 Getter = Callable
 Field = Tuple[FieldAlias, Getter, Union[Callable, None]]
-GetterGeneratorFunc = Generator[Union[None, Dict], Type[object], None]
-GetterManyGeneratorFunc = Generator[Union[None, List[Dict]], List[Type[object]], None]
+IsOptional = bool
+AttributeNames = Union[Tuple[str, ...], None]
+FieldAccessor = Tuple[IsOptional, AttributeNames]
+
+# ------------------------------------------------------------------------------------- #
+# CONSTANTS
+
+DUNDER = re.compile(r"(?<!_)__")
+# Objects serialized during the current serialization
+MEMO: ContextVar = ContextVar("MEMO", default=None)
+# Options of the 'json.dumps' function that can be translated for the 'orjson.dumps'
+ORJSON_COMPATIBLE_OPTIONS = {"sort_keys", "indent"}
 
 
 class AnnotationsChainMap(ChainMap):
@@ -34,9 +79,31 @@ class AnnotationsChainMap(ChainMap):
     def __iter__(self):
         # Overriding '__iter__' in order to
         # maintain the order of the unique keys
+        if len(self.maps) == 1:
+            return iter(self.maps[0])
         return iter(dict.fromkeys(chain.from_iterable(self.maps)))
 
 
+class LRUCache(OrderedDict):
+    """Ordered dictionary that holds at most 'maxsize' items
+    and evicts the least recently used item when it is full."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        super().__init__()
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        if len(self) > self.maxsize:
+            self.popitem(last=False)
+
+
 class HasNoAttribute:
     """Singleton class."""
 
@@ -48,7 +115,11 @@ class HasNoAttribute:
         return cls._instance
 
 
-def construct_accessor(attribute: str, accessor: str = "") -> str:
+HAS_NO_ATTRIBUTE = HasNoAttribute()
+
+
+@lru_cache(maxsize=None)
+def construct_accessor(attribute: str) -> str:
     """Given the attribute, construct appropriate accessor.
 
     Example:
@@ -58,97 +129,244 @@ def construct_accessor(attribute: str, accessor: str = "") -> str:
         ...
     """
 
-    def valid(string: str) -> Union[str, bool]:
-        """Validate that string does not contain only underscores."""
+    # Leading and trailing underscores are never treated as the accessor
+    stripped = attribute.lstrip("_")
+    prefix = attribute[: len(attribute) - len(stripped)]
+    core = stripped.rstrip("_")
+    suffix = stripped[len(core) :]
 
-        return string and not string == len(string) * "_"
+    if "____" in core:
+        # Only the first two underscores of the longer runs become the accessor
+        core = DUNDER.sub(".", core)
+    else:
+        core = core.replace("__", ".")
+
+    return prefix + core + suffix
 
-    before, dunder, after = attribute.partition("__")
 
-    if valid(before) and valid(after):
-        accessor += before + "."
-        return construct_accessor(after, accessor)
+def serialize_many(serialize_one: Callable[[Any], Dict]) -> Callable[[Any], List[Dict]]:
+    """Wrapper around the generated serialization function
+    to allow serialisation of multiple objects."""
 
-    accessor += before + dunder
+    def _run(objects: List[Any]) -> List[Dict]:
+        return [serialize_one(obj) for obj in objects]
 
-    if valid(after):
-        return construct_accessor(after, accessor)
+    return _run
 
-    return accessor + after
 
+def compile_getters(
+    fields: Sequence[Field], accessors: Sequence[FieldAccessor]
+) -> Callable[[Any], Dict]:
+    """Generate the function that applies the getter methods on the passed object.
 
-def coroutine(func: Callable) -> Callable:
-    """Decorator that primes the coroutine
-    and returns the generator 'send' function."""
+    Source code is generated with one statement per field, getters and callables
+    are bound as the default arguments, and the check against the 'HasNoAttribute'
+    is emitted only for the optional fields. When the attribute names of the field
+    are known, they are inlined into the source instead of calling the getter.
+    """
 
-    @wraps(func)
-    def wrapper(*args, **kwargs):
-        gen_func = func(*args, **kwargs)
-        next(gen_func)
-        return gen_func.send
+    namespace = {"_S": HAS_NO_ATTRIBUTE}
+    arguments = ["o", "_S=_S"]
+    body = ["r = {}"]
+
+    for index, ((field_alias, getter, callable_), (optional, names)) in enumerate(
+        zip(fields, accessors)
+    ):
+        if names is None:
+            namespace[f"_g{index}"] = getter
+            arguments.append(f"_g{index}=_g{index}")
+            value = f"_g{index}(o)"
+        else:
+            value = "o"
+            for name in names:
+                if optional:
+                    value = f"getattr({value}, {name!r}, _S)"
+                # Non-ASCII identifiers are NFKC normalized in the source code
+                elif (
+                    name.isidentifier()
+                    and not keyword.iskeyword(name)
+                    and unicodedata.normalize("NFKC", name) == name
+                ):
+                    value = f"{value}.{name}"
+                else:
+                    value = f"getattr({value}, {name!r})"
+
+        # Literal keeps the exact type only for the plain strings
+        if type(field_alias) is str:
+            key = repr(field_alias)
+        else:
+            key = f"_a{index}"
+            namespace[key] = field_alias
+            arguments.append(f"{key}={key}")
+
+        if callable_ is not None:
+            namespace[f"_c{index}"] = callable_
+            arguments.append(f"_c{index}=_c{index}")
+
+        if optional:
+            body.append(f"v = {value}")
+            body.append("if v is not _S:")
+            body.append(
+                f"    r[{key}] = _c{index}(v)"
+                if callable_ is not None
+                else f"    r[{key}] = v"
+            )
+        else:
+            body.append(
+                f"r[{key}] = _c{index}({value})"
+                if callable_ is not None
+                else f"r[{key}] = {value}"
+            )
+
+    body.append("return r")
+    source = "def _serialize_one({}):\n    {}".format(
+        ", ".join(arguments), "\n    ".join(body)
+    )
+    exec(source, namespace)
+
+    return namespace["_serialize_one"]
+
+
+def memoize(func: Callable[[Any], Dict]) -> Callable[[Any], Dict]:
+    """Wrapper around the serialization function that reuses
+    the serialized data of the object that was already serialized."""
+
+    def _run(object_: Any) -> Dict:
+        cache = MEMO.get()
+        if cache is None:
+            return func(object_)
+
+        key = (func, id(object_))
+        if key in cache:
+            return cache[key][1]
+
+        # Object is kept alive as well so its 'id' can not be reused
+        ser = func(object_)
+        cache[key] = (object_, ser)
+        return ser
+
+    return _run
+
+
+def get_attr(attributes: str) -> Callable[[Any], Union[Any, HasNoAttribute]]:
+    """Return the attribute getter that returns
+    'HasNoAttribute' instead of raising 'AttributeError'."""
 
-    return wrapper
+    names = attributes.split(".")
 
+    if len(names) == 1:
+        attr, = names
+        return lambda obj: getattr(obj, attr, HAS_NO_ATTRIBUTE)
 
-@coroutine
-def apply_getters(fields: List[Field]) -> Union[Callable, GetterGeneratorFunc]:
-    """Apply the getter methods on the passed object."""
+    if len(names) == 2:
+        first, second = names
+        return lambda obj: getattr(
+            getattr(obj, first, HAS_NO_ATTRIBUTE), second, HAS_NO_ATTRIBUTE
+        )
 
-    # Setup phase
-    has_no_attribute = HasNoAttribute()
+    def _run(obj: Any) -> Union[Any, HasNoAttribute]:
+        for attr in names:
+            obj = getattr(obj, attr, HAS_NO_ATTRIBUTE)
+        return obj
 
-    # Main phase
-    object_ = yield
+    return _run
 
-    while True:
-        ser = {}
-        for field_alias, getter, callable_ in fields:
-            value = getter(object_)
-            if value is has_no_attribute:
-                continue
-            if callable_ is None:
-                ser[field_alias] = value
-            else:
-                ser[field_alias] = callable_(value)
-        object_ = yield ser
 
+def orjson_dumps(obj: Any, default: Callable, **options) -> str:
+    """Serialize the object to the json string using 'orjson'.
 
-@coroutine
-def apply_getters_many(fields: List[Field]) -> Union[Callable, GetterManyGeneratorFunc]:
-    """Wrapper around 'apply_getters' function to
-    allow serialisation of multiple objects."""
+    Only the 'sort_keys' and 'indent=2' options of the 'json.dumps' can be translated.
+    """
 
-    # Setup phase
-    getter = apply_getters(fields)
+    if orjson is None:
+        raise SerializerError("'orjson' needs to be installed in order to use it")
+    if not options.keys() <= ORJSON_COMPATIBLE_OPTIONS or options.get(
+        "indent"
+    ) not in (None, 2):
+        raise SerializerError(
+            f"Options not supported by 'orjson' are being passed: "
+            f"{', '.join(map(str, options.items()))}"
+        )
+
+    # Objects that 'orjson' serializes natively are passed to the 'default' as well
+    option = (
+        orjson.OPT_PASSTHROUGH_DATACLASS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_NON_STR_KEYS
+    )
+    if options.get("sort_keys"):
+        option |= orjson.OPT_SORT_KEYS
+    if options.get("indent") == 2:
+        option |= orjson.OPT_INDENT_2
+
+    # 'orjson' replaces errors raised by the 'default' with its own error,
+    # errors raised by the getters are recorded and propagated unchanged
+    errors = []
+
+    def _default(object_: Any) -> Any:
+        try:
+            return default(object_)
+        except Exception as error:
+            errors.append(error)
+            raise
+
+    try:
+        return orjson.dumps(obj, default=_default, option=option).decode()
+    except orjson.JSONEncodeError:
+        if errors:
+            raise errors[-1] from None
+        raise
+
+
+def iterencode_array(
+    objects: Iterable[Any],
+    encode: Callable[[Any], Iterable[str]],
+    item_separator: str,
+    indent: Union[str, None],
+) -> Iterator[str]:
+    """Serialize the list of the objects to the chunks of the json array,
+    every object is encoded separately with the passed 'encode' function."""
+
+    # Newlines are always escaped inside the json strings, hence the encoded object
+    # is indented one level deeper by indenting every line that it contains
+    newline = "" if indent is None else "\n" + indent
+    separator = "[" + newline
+
+    for obj in objects:
+        yield separator
+        for chunk in encode(obj):
+            yield chunk.replace("\n", newline) if newline else chunk
+        separator = item_separator + newline
+
+    if separator == "[" + newline:
+        yield "[]"
+    else:
+        yield "]" if indent is None else "\n]"
 
-    # Main phase
-    objects = yield
 
-    while True:
-        objects = yield [getter(obj) for obj in objects]
+def json_iterencode(objects: Iterable[Any], encoder: JSONEncoder) -> Iterator[str]:
+    """Serialize the list of the objects to the chunks of the json string,
+    joined chunks are equal to the output of the 'json.dumps'."""
 
+    indent = encoder.indent
+    if indent is not None and not isinstance(indent, str):
+        indent = " " * indent
 
-@coroutine
-def get_attr(attributes: str) -> Union[Any, HasNoAttribute]:
-    """Get attribute function that works as coroutine."""
+    return iterencode_array(objects, encoder.iterencode, encoder.item_separator, indent)
 
-    # Setup phase
-    getattr_ = getattr
-    has_no_attribute = HasNoAttribute()
-    names = attributes.split(".")
 
-    # Main phase
-    obj = yield
+def orjson_iterencode(
+    objects: Iterable[Any], default: Callable, **options
+) -> Iterator[str]:
+    """Serialize the list of the objects to the chunks of the json string using
+    'orjson', joined chunks are equal to the output of the 'orjson_dumps'."""
 
-    if len(names) == 1:
-        attr, = names
-        while True:
-            obj = yield getattr_(obj, attr, has_no_attribute)
-    else:
-        while True:
-            for attr in names:
-                obj = getattr_(obj, attr, has_no_attribute)
-            obj = yield obj
+    return iterencode_array(
+        objects,
+        lambda obj: (orjson_dumps(obj, default, **options),),
+        ",",
+        "  " if options.get("indent") == 2 else None,
+    )
 
 
 def add_docstring(